@@ -0,0 +1,195 @@
+import argparse
+import copy
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error
+from sklearn.model_selection import train_test_split
+
+from vetor_features import COLUNAS, construir_matriz, prever, verificar_ordem
+
+QTD_ARVORES = [5, 10, 20, 30, 50, 75, 100, 150, 200, 300, 500]
+REPETICOES_LATENCIA = 50
+ARQUIVO_MODELO_ORIGINAL = 'modelo_rf_otimizado_target.pkl'
+AVISO_IN_SAMPLE = ('Aviso: holdout sorteado de dataframe_let.csv, sem '
+                   'garantia de que essas linhas ficaram fora do treino do '
+                   'modelo; o encoder também é ajustado com elas. O MAE '
+                   'tende a ser in-sample e a subestimar a perda de '
+                   'precisão da poda. '
+                   'Use --arquivo-holdout com dados fora do treino.')
+
+
+def carregar_modelo(arquivo: str) -> object:
+    """
+    Loads the pickled RandomForest model served by the app.
+
+    Parameters:
+        arquivo (str): Path of the pickle file.
+
+    Returns:
+        object: The fitted forest.
+
+    Raises:
+        ValueError: If the pickled object is not a fitted tree ensemble.
+    """
+    with open(arquivo, 'rb') as model_file:
+        modelo = pickle.load(model_file)
+    if not hasattr(modelo, 'estimators_'):
+        raise ValueError(f'{arquivo} não contém uma floresta treinada.')
+    verificar_ordem(modelo)
+    return modelo
+
+
+def dados_holdout(proporcao: float, semente: int,
+                  arquivo: str = None) -> tuple:
+    """
+    Builds the holdout data in the model schema.
+
+    When ``arquivo`` is given, its listings are used as the holdout. Otherwise
+    a random split of ``dataframe_let.csv`` is used; nothing guarantees those
+    rows were held out when the shipped model was trained, and the target
+    encoder in ``vetor_features`` is fitted on all rows, so the resulting
+    error is likely in-sample and understates the accuracy lost by pruning.
+
+    Parameters:
+        proporcao (float): Fraction of the rows kept for the holdout.
+        semente (int): Random seed of the split.
+        arquivo (str, optional): A CSV in the ``dataframe_let.csv`` format
+            with listings not used in training. Defaults to None.
+
+    Returns:
+        tuple: The holdout feature matrix and the prices in R$.
+    """
+    if arquivo is not None:
+        holdout = pd.read_csv(arquivo, sep=';')
+    else:
+        dados = pd.read_csv('dataframe_let.csv', sep=';')
+        _, holdout = train_test_split(dados, test_size=proporcao,
+                                      random_state=semente)
+    holdout = holdout.dropna(subset=COLUNAS + ['preco'])
+    matriz = construir_matriz(holdout[COLUNAS].to_dict('records'))
+    return matriz, holdout['preco'].to_numpy()
+
+
+def podar_floresta(modelo: object, qtd_arvores: int) -> object:
+    """
+    Returns a copy of the forest that keeps only its first trees.
+
+    The trees of a random forest are independent, so keeping the first
+    ``qtd_arvores`` is an unbiased subsample of the full ensemble.
+
+    Parameters:
+        modelo (object): The fitted forest.
+        qtd_arvores (int): Number of trees to keep.
+
+    Returns:
+        object: The pruned forest.
+    """
+    podado = copy.copy(modelo)
+    podado.estimators_ = modelo.estimators_[:qtd_arvores]
+    podado.n_estimators = qtd_arvores
+    return podado
+
+
+def avaliar_variante(modelo: object, matriz: np.ndarray,
+                     precos: np.ndarray) -> dict:
+    """
+    Measures the size, load time, latency and error of one model variant.
+
+    Parameters:
+        modelo (object): The model variant to evaluate.
+        matriz (numpy.ndarray): The holdout feature matrix.
+        precos (numpy.ndarray): The holdout prices in R$.
+
+    Returns:
+        dict: The measurements of the variant.
+    """
+    serializado = pickle.dumps(modelo, protocol=pickle.HIGHEST_PROTOCOL)
+
+    inicio = time.perf_counter()
+    pickle.loads(serializado)
+    tempo_carga = time.perf_counter() - inicio
+
+    linha = matriz[:1]
+    latencias = []
+    for _ in range(REPETICOES_LATENCIA):
+        inicio = time.perf_counter()
+        prever(modelo, linha)
+        latencias.append(time.perf_counter() - inicio)
+
+    previsoes = np.expm1(prever(modelo, matriz))
+    return {
+        'arvores': len(modelo.estimators_),
+        'tamanho_mb': len(serializado) / 1024 ** 2,
+        'carga_ms': tempo_carga * 1000,
+        'latencia_ms': float(np.median(latencias)) * 1000,
+        'mae': mean_absolute_error(precos, previsoes),
+        'serializado': serializado,
+    }
+
+
+def main() -> None:
+    """
+    Produces the smallest forest variant whose holdout error stays within the
+    accuracy budget and prints the size, load time, latency and error
+    tradeoff of every candidate.
+
+    The chosen variant is written to ``--saida``; point the
+    ``MODELO_VARIANTE`` environment variable at it to serve it in the app.
+
+    Example:
+        python compactar_modelo.py --orcamento 0.02
+        MODELO_VARIANTE=modelo_rf_compacto.pkl streamlit run dashboard.py
+    """
+    parser = argparse.ArgumentParser(
+        description='Compacta a floresta do modelo dentro de um orçamento '
+                    'de erro.')
+    parser.add_argument('--orcamento', type=float, default=0.02,
+                        help='Aumento relativo máximo do MAE no holdout.')
+    parser.add_argument('--modelo', default=ARQUIVO_MODELO_ORIGINAL,
+                        help='Arquivo do modelo original.')
+    parser.add_argument('--saida', default='modelo_rf_compacto.pkl',
+                        help='Arquivo onde a variante escolhida é salva.')
+    parser.add_argument('--holdout', type=float, default=0.2,
+                        help='Proporção dos dados usada como holdout.')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--arquivo-holdout', default=None,
+                        help='CSV com anúncios fora do treino do modelo, '
+                             'usado no lugar do sorteio de holdout.')
+    args = parser.parse_args()
+    if args.orcamento < 0:
+        parser.error('--orcamento não pode ser negativo.')
+
+    modelo = carregar_modelo(args.modelo)
+    matriz, precos = dados_holdout(args.holdout, args.semente,
+                                   args.arquivo_holdout)
+    if args.arquivo_holdout is None:
+        print(AVISO_IN_SAMPLE)
+
+    original = avaliar_variante(modelo, matriz, precos)
+    limite_mae = original['mae'] * (1 + args.orcamento)
+    candidatos = [podar_floresta(modelo, qtd) for qtd in QTD_ARVORES
+                  if qtd < len(modelo.estimators_)]
+    variantes = [avaliar_variante(c, matriz, precos) for c in candidatos]
+    variantes.append(original)
+
+    print(f"{'árvores':>8} {'MB':>8} {'carga ms':>9} {'pred ms':>8} "
+          f"{'MAE R$':>11} {'Δ MAE':>7}")
+    for v in variantes:
+        aumento = v['mae'] / original['mae'] - 1
+        print(f"{v['arvores']:>8} {v['tamanho_mb']:>8.2f} "
+              f"{v['carga_ms']:>9.1f} {v['latencia_ms']:>8.2f} "
+              f"{v['mae']:>11,.2f} {aumento:>7.2%}")
+
+    escolhida = min((v for v in variantes if v['mae'] <= limite_mae),
+                    key=lambda v: v['tamanho_mb'])
+    with open(args.saida, 'wb') as model_file:
+        model_file.write(escolhida['serializado'])
+    print(f"Variante com {escolhida['arvores']} árvores salva em "
+          f"{args.saida}.")
+
+
+if __name__ == '__main__':
+    main()
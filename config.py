@@ -1,3 +1,4 @@
+import os
 import pickle
 
 import pandas as pd
@@ -12,8 +13,10 @@ KM_ESCOLHA = [0, 1000, 10000, 20000, 30000, 40000, 50000, 60000, 70000, 80000,
 CORES_ESCOLHA = ['Branco', 'Preto', 'Prata', 'Cinza']
 CIDADE_UNICO = sorted(DADOS_MACHINE_LEARNING['cidade'].unique())
 MOTOR_UNICO = DADOS_MACHINE_LEARNING['motor'].unique()
+ARQUIVO_MODELO = os.environ.get('MODELO_VARIANTE',
+                                'modelo_rf_otimizado_target.pkl')
 
-with open('modelo_rf_otimizado_target.pkl', 'rb') as model_file:
+with open(ARQUIVO_MODELO, 'rb') as model_file:
     MODELO = pickle.load(model_file)
 
 with open('mapa_veiculos.html', 'r') as file:
@@ -1,8 +1,10 @@
 import streamlit as st
 
 from conclusao_projeto import conclusao
+from config import DADOS
 from estatistica import estatisticas
 from estudo_de_dados import graficos
+from indice_filtros import COLUNAS_CATEGORICAS, INDICE, filtrar_dados
 from modelo_predicao import predicao
 from problema_resolvido import problema_ser_resolvido
 
@@ -25,30 +27,56 @@ st.sidebar.markdown(f'**[LinkedIn]( {linkedin_url} )** e **[Github]( {github_url
 st.sidebar.divider()
 
 # Add selectbox
-opcoes = ["❓ Problema a ser resolvido", "📝 Estatisticas do dataframe",
-          "👩‍🏭 Estudo dos dados",
-          "🛠️ Modelo de predição", "💵 Conclusão"]
+PAGINA_PROBLEMA = "❓ Problema a ser resolvido"
+PAGINA_ESTATISTICAS = "📝 Estatisticas do dataframe"
+PAGINA_ESTUDO = "👩‍🏭 Estudo dos dados"
+PAGINA_PREDICAO = "🛠️ Modelo de predição"
+PAGINA_CONCLUSAO = "💵 Conclusão"
+opcoes = [PAGINA_PROBLEMA, PAGINA_ESTATISTICAS, PAGINA_ESTUDO,
+          PAGINA_PREDICAO, PAGINA_CONCLUSAO]
 selecao = st.sidebar.selectbox(
     "Quais informações você quer verificar?",
     (opcoes)
 )
 
-
-if selecao == "❓ Problema a ser resolvido":
+# Filtros globais (apenas nas páginas que usam os dados)
+sem_resultados = False
+if selecao in (PAGINA_ESTATISTICAS, PAGINA_ESTUDO):
+    st.sidebar.divider()
+    st.sidebar.markdown("**Filtros dos anúncios:**")
+    rotulos_filtros = {'cidade': 'Cidade', 'modelo': 'Modelo',
+                       'combustivel': 'Combustível', 'cor': 'Cor'}
+    filtros = {col: st.sidebar.multiselect(rotulos_filtros[col],
+                                           sorted(INDICE[col]))
+               for col in COLUNAS_CATEGORICAS}
+    ano_min_dados = int(DADOS['ano'].min())
+    ano_max_dados = int(DADOS['ano'].max())
+    anos = st.sidebar.slider("Ano", min_value=ano_min_dados,
+                             max_value=ano_max_dados,
+                             value=(ano_min_dados, ano_max_dados))
+    if anos == (ano_min_dados, ano_max_dados):
+        anos = None
+    dados_filtrados = filtrar_dados(filtros, anos)
+    sem_resultados = dados_filtrados.empty
+    if sem_resultados:
+        st.warning('Nenhum veículo encontrado com os filtros selecionados.')
+
+
+if selecao == PAGINA_PROBLEMA:
     problema_ser_resolvido()
 
 
-if selecao == "📝 Estatisticas do dataframe":
-    estatisticas()
+if selecao == PAGINA_ESTATISTICAS and not sem_resultados:
+    estatisticas(dados_filtrados)
 
 
-if selecao == '👩‍🏭 Estudo dos dados':
-    graficos()
+if selecao == PAGINA_ESTUDO and not sem_resultados:
+    graficos(dados_filtrados)
 
 
-if selecao == '🛠️ Modelo de predição':
+if selecao == PAGINA_PREDICAO:
     predicao()
 
 
-if selecao == '💵 Conclusão':
+if selecao == PAGINA_CONCLUSAO:
     conclusao()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import pandas as pd
 import streamlit as st
 
 from config import DADOS
@@ -25,14 +26,14 @@ def formata_numero(valor: float, prefixo: str = '') -> str:
     return f'{prefixo} {valor:.2f}'
 
 
-def estatisticas() -> None:
+def estatisticas(dados: pd.DataFrame = DADOS) -> None:
     """
     Function to generate statistics and display them using the Streamlit library.
 
-    This function generates various statistics about a dataset called DADOS and displays them using the Streamlit library. The statistics include general information about the dataset, such as the total number of vehicles, the most sold car model, and the most used fuel type. It also includes statistics about the price of the vehicles, such as the minimum, average, and maximum prices. Additionally, it provides statistics about the year and mileage of the vehicles.
+    This function generates various statistics about the given listings (DADOS by default) and displays them using the Streamlit library. The statistics include general information about the dataset, such as the total number of vehicles, the most sold car model, and the most used fuel type. It also includes statistics about the price of the vehicles, such as the minimum, average, and maximum prices. Additionally, it provides statistics about the year and mileage of the vehicles.
 
     Parameters:
-    None
+    dados (pd.DataFrame): The listings to describe, after the sidebar filters.
 
     Returns:
     None
@@ -42,19 +43,19 @@ def estatisticas() -> None:
     st.subheader("Estatísticas gerais")
     coluna11, coluna12, coluna13 = st.columns(3)
     with coluna11:
-        qtd_veiculos = DADOS.shape[0]
+        qtd_veiculos = dados.shape[0]
         st.metric('Quantidade total de veiculos :', qtd_veiculos)
     with coluna12:
-        modelo_mais_vendido = DADOS['modelo'].value_counts().idxmax()
+        modelo_mais_vendido = dados['modelo'].value_counts().idxmax()
         st.metric('Carro mais vendido:', modelo_mais_vendido)
     with coluna13:
-        tipo_combustivel = DADOS['combustivel'].value_counts().idxmax()
+        tipo_combustivel = dados['combustivel'].value_counts().idxmax()
         st.metric('Tipo de combustivel mais usado pelos veículos:',
                   tipo_combustivel)
 
     coluna14, coluna15 = st.columns(2)
     with coluna14:
-        cor_mais_comum = DADOS['cor'].value_counts().idxmax()
+        cor_mais_comum = dados['cor'].value_counts().idxmax()
         st.metric('Cor mais comum entre os veículos', cor_mais_comum)
 
     st.divider()
@@ -62,13 +63,13 @@ def estatisticas() -> None:
     st.subheader("Estatísticas para o preço")
     coluna1, coluna2, coluna3 = st.columns(3)
     with coluna1:
-        preco_min = DADOS['preco'].min()
+        preco_min = dados['preco'].min()
         st.metric('Veículo mais barato:', formata_numero(preco_min, 'R$'))
     with coluna2:
-        preco_med = DADOS['preco'].mean()
+        preco_med = dados['preco'].mean()
         st.metric('Preço médio dos veículos:', formata_numero(preco_med, 'R$'))
     with coluna3:
-        preco_max = DADOS['preco'].max()
+        preco_max = dados['preco'].max()
         st.metric('Veículo mais caro:', formata_numero(preco_max, 'R$'))
 
     st.divider()
@@ -76,30 +77,28 @@ def estatisticas() -> None:
     st.subheader("Estatísticas do ano dos veículos")
     coluna4, coluna5, coluna6 = st.columns(3)
     with coluna4:
-        menor_ano_veiculos = DADOS['ano'].min()
+        menor_ano_veiculos = dados['ano'].min()
         st.metric('Veículo mais antigo:', int(menor_ano_veiculos))
     with coluna5:
-        media_ano_veiculos = DADOS['ano'].mean()
+        media_ano_veiculos = dados['ano'].mean()
         st.metric('Ano médio dos veículos:', int(media_ano_veiculos))
     with coluna6:
-        maior_ano_veiculos = DADOS['ano'].max()
+        maior_ano_veiculos = dados['ano'].max()
         st.metric('Veículo mais novo:', int(maior_ano_veiculos))
 
     st.divider()
 
     st.subheader("Estatísticas de quilometragem dos veículos")
     coluna7, coluna8, coluna9 = st.columns(3)
+    possui_km = dados['km'].notna().any()
     with coluna7:
-        menor_km = int(DADOS['km'].min())
+        menor_km = int(dados['km'].min()) if possui_km else 'N/D'
         st.metric('Veículo com a quilometragem mais baixa:', menor_km)
     with coluna8:
-        media_km = round(DADOS['km'].mean())
-        DADOS['km'].fillna(media_km, inplace=True)
-        st.metric('Média de quilometragem dos veículos:',
-                f'{media_km:.2f} mil')
+        media_km = f"{round(dados['km'].mean()):.2f} mil" if possui_km else 'N/D' # noqa
+        st.metric('Média de quilometragem dos veículos:', media_km)
     with coluna9:
-        maior_km = round(DADOS['km'].max())
-        st.metric('Veículo com a quilometragem mais alta:',
-                f'{maior_km:.2f} mil')
+        maior_km = f"{round(dados['km'].max()):.2f} mil" if possui_km else 'N/D' # noqa
+        st.metric('Veículo com a quilometragem mais alta:', maior_km)
 
     st.divider()
\ No newline at end of file
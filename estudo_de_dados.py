@@ -8,7 +8,7 @@ from config import DADOS, MAPA
 dados = DADOS
 
 
-def graficos():
+def graficos(dados: pd.DataFrame = DADOS):
     """
     Generate various data visualizations and insights based on the provided data.
 
@@ -16,11 +16,14 @@ def graficos():
     features, and trends. It includes bar charts, maps, correlation matrices, and more, providing valuable insights
     into the dataset.
 
+    Parameters:
+        dados (pd.DataFrame): The listings to plot, after the sidebar filters.
+
     Returns:
         None
     """
     # Gráfico barras (Variação de preço por ano de fabricação do veículo)
-    filtro_ano = DADOS[(DADOS['ano'] >= 2013) & (DADOS['ano'] <= 2023)]
+    filtro_ano = dados[(dados['ano'] >= 2013) & (dados['ano'] <= 2023)]
     preco_por_ano = filtro_ano.groupby('ano')['preco'].mean().round(2). \
         reset_index()
 
@@ -104,7 +107,7 @@ def graficos():
        
         return correlation_matrix
  
-    correlation_matrix = calculate_correlation_matrix(DADOS)
+    correlation_matrix = calculate_correlation_matrix(dados)
 
     fig = px.imshow(correlation_matrix,
                     x=correlation_matrix.columns,
@@ -150,8 +153,9 @@ def graficos():
     st.divider()
 
     # Gráfico de barras (Modelo com maior número de opcionais)
-    dados['total_caracteristicas'] = dados[caracteristicas].sum(axis=1)
-    top_models = dados.nlargest(10, 'total_caracteristicas')
+    dados_opcionais = dados[['modelo']].copy()
+    dados_opcionais['total_caracteristicas'] = dados[caracteristicas].sum(axis=1) # noqa
+    top_models = dados_opcionais.nlargest(10, 'total_caracteristicas')
     top_models = top_models.sort_values('total_caracteristicas')
     fig = px.bar(top_models, x='total_caracteristicas', y='modelo',
                  labels={'total_caracteristicas': 'Opcionais',
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+from config import DADOS
+
+COLUNAS_CATEGORICAS = ['cidade', 'modelo', 'combustivel', 'cor']
+
+
+def construir_indice(dados: pd.DataFrame) -> dict:
+    """
+    Precomputes a sorted-position index for the listing filters.
+
+    For every categorical column, each value maps to the sorted array of the
+    row positions that hold it. For 'ano', the row positions are stored
+    ordered by year next to the sorted years, so a year range is a slice.
+
+    Parameters:
+        dados (pd.DataFrame): The listings to be indexed.
+
+    Returns:
+        dict: The position index for each filter column.
+    """
+    indice = {}
+    for col in COLUNAS_CATEGORICAS:
+        grupos = dados.groupby(col).indices
+        indice[col] = {valor: np.sort(posicoes)
+                       for valor, posicoes in grupos.items()}
+
+    anos = dados['ano'].to_numpy()
+    com_ano = np.flatnonzero(~np.isnan(anos))
+    ordem = com_ano[np.argsort(anos[com_ano], kind='stable')]
+    indice['ano'] = (anos[ordem], ordem)
+    return indice
+
+
+INDICE = construir_indice(DADOS)
+
+
+def posicoes_valores(coluna: str, valores: list) -> np.ndarray:
+    """
+    Combines the position lists of the selected values of a column with OR.
+
+    A row holds a single value per column, so the lists are disjoint and the
+    union is their concatenation, sorted.
+
+    Parameters:
+        coluna (str): The categorical column being filtered.
+        valores (list): The selected values.
+
+    Returns:
+        np.ndarray: The sorted positions of the rows matching any value.
+    """
+    listas = [INDICE[coluna][valor] for valor in valores
+              if valor in INDICE[coluna]]
+    if not listas:
+        return np.empty(0, dtype=np.intp)
+    return np.sort(np.concatenate(listas))
+
+
+def posicoes_anos(ano_minimo: int, ano_maximo: int) -> np.ndarray:
+    """
+    Returns the positions of the rows whose year lies in the given range.
+
+    Parameters:
+        ano_minimo (int): The first year of the range.
+        ano_maximo (int): The last year of the range.
+
+    Returns:
+        np.ndarray: The sorted positions of the rows in the range.
+    """
+    anos, ordem = INDICE['ano']
+    inicio = np.searchsorted(anos, ano_minimo, side='left')
+    fim = np.searchsorted(anos, ano_maximo, side='right')
+    return np.sort(ordem[inicio:fim])
+
+
+def filtrar_dados(filtros: dict, anos: tuple = None) -> pd.DataFrame:
+    """
+    Returns the listings matching every filter, using the precomputed index.
+
+    Values selected in the same column are combined with OR and the columns
+    are combined with AND, intersecting the position lists smallest first,
+    so the cost follows the size of the matched lists rather than a scan of
+    the whole column per predicate.
+
+    Parameters:
+        filtros (dict): Selected values per categorical column. Columns with
+            no selected values are not filtered.
+        anos (tuple, optional): The (minimum, maximum) year range.
+            Defaults to None, which does not filter by year.
+
+    Returns:
+        pd.DataFrame: The filtered listings, or DADOS when no filter is set.
+    """
+    listas = [posicoes_valores(col, valores)
+              for col, valores in filtros.items() if valores]
+    if anos is not None:
+        listas.append(posicoes_anos(*anos))
+    if not listas:
+        return DADOS
+
+    listas.sort(key=len)
+    posicoes = listas[0]
+    for outras in listas[1:]:
+        posicoes = np.intersect1d(posicoes, outras, assume_unique=True)
+    return DADOS.take(posicoes)
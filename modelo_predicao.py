@@ -1,12 +1,12 @@
 import numpy as np
-import pandas as pd
 import streamlit as st
-from category_encoders import TargetEncoder
-from sklearn.preprocessing import FunctionTransformer
 
 from config import (ANO_ESCOLHA, CIDADE_UNICO, COMBUSTIVEL_UNICO,
                     CORES_ESCOLHA, DADOS_MACHINE_LEARNING, KM_ESCOLHA, MODELO,
                     MODELO_UNICO, MOTOR_UNICO)
+from vetor_features import COLUNAS, construir_vetor, prever, verificar_ordem
+
+verificar_ordem(MODELO)
 
 dataframe_machine_learning = DADOS_MACHINE_LEARNING
 modelo_unico = MODELO_UNICO
@@ -37,46 +37,19 @@ def predicao():
     The predicted value is formatted as a currency and displayed on the screen.
     If not all fields are filled, an error message is displayed.
     """
-    columns = ['modelo', 'combustivel', 'ano', 'km', 'cor', 'cambio',
-               'cidade', 'airbag motorista', 'freios ABS', 'airbag passageiro',
-               'ar-condicionado', 'direção elétrica',
-               'volante com regulagem de altura', 'travas elétricas',
-               'cd player com MP3', 'entrada USB',
-               'vidros elétricos dianteiros',
-               'limajuste de alturap. traseiro',
-               'desemb. traseiro', 'alarme',
-               'ajuste de altura',
-               'distribuição eletrônica de frenagem,',
-               'controle de tração',
-               'retrovisores elétricos', 'piloto automático', 'Kit Multimídia',
-               'bancos de couro', 'limp. traseiro', 'motor']
-
-    def transform_data(user_input: list) -> pd.DataFrame:
+    columns = COLUNAS
+
+    def transform_data(user_input: dict) -> np.ndarray:
         """
-        Transforms user input data into a transformed dataframe.
+        Transforms user input data into the model feature matrix.
 
         Parameters:
-            user_input (list): A list containing user input data.
+            user_input (dict): A dict containing user input data.
 
         Returns:
-            pandas.DataFrame: A dataframe containing the transformed data.
+            numpy.ndarray: A single-row matrix containing the transformed data.
         """
-        novo_veiculo_df = pd.DataFrame([user_input], columns=columns)
-        transformer = FunctionTransformer(np.log1p, validate=True)
-        dados_transformados = transformer.transform(novo_veiculo_df.select_dtypes(exclude=['object'])) # noqa
-        colunas_dados_transformados = novo_veiculo_df.select_dtypes(exclude=['object']).columns # noqa
-        novo_veiculo_transformado = pd.concat([
-            novo_veiculo_df.select_dtypes(include=['object']),
-            pd.DataFrame(dados_transformados,
-                         columns=colunas_dados_transformados)
-        ], axis=1)
-        dados_limpos = pd.read_csv('dataframe_let.csv', sep=';').drop('Unnamed: 0', axis=1) # noqa
-        encoder = TargetEncoder()
-        variaveis_categoricas = ['modelo', 'combustivel', 'cor', 'cidade']
-        encoder.fit(dados_limpos[variaveis_categoricas], dados_limpos['preco'])
-        novo_veiculo_transformado[variaveis_categoricas] = encoder.transform(dados_limpos[variaveis_categoricas]) # noqa
-
-        return novo_veiculo_transformado
+        return construir_vetor(user_input)
 
     def make_prediction(data: object) -> object:
         """
@@ -88,7 +61,7 @@ def predicao():
         Returns:
             object: The predicted value after applying the model.
         """
-        nova_previsao = MODELO.predict(data)
+        nova_previsao = prever(MODELO, data)
         nova_previsao_valor_original = np.expm1(nova_previsao)
         return nova_previsao_valor_original
 
@@ -0,0 +1,183 @@
+"""
+Load test for the dashboard with many headless sessions at once.
+
+Each session runs in its own worker process, because ``AppTest`` keeps
+process-wide Streamlit state. The results therefore show process-isolated
+scaling, not the capacity of a single Streamlit server: contention for the
+GIL and for shared caches inside one server process is not measured, and the
+reported RSS is per worker process.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+ARQUIVO_APP = 'dashboard.py'
+PAGINA_PREDICAO = '🛠️ Modelo de predição'
+TIMEOUT_RERUN = 60
+
+
+def memoria_rss_mb() -> tuple:
+    """
+    Returns the resident set size (RSS) of this process in megabytes.
+
+    Reads the current RSS from ``/proc/self/status`` when available and falls
+    back to the peak RSS reported by ``resource.getrusage`` on other
+    platforms, where ``ru_maxrss`` is in bytes on macOS and in KB elsewhere.
+    ``resource`` is POSIX only, so on Windows the RSS is reported as NaN.
+
+    Returns:
+        tuple: The resident memory in MB and whether it is the peak value.
+    """
+    try:
+        with open('/proc/self/status', 'r') as status:
+            for linha in status:
+                if linha.startswith('VmRSS:'):
+                    return int(linha.split()[1]) / 1024, False
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return float('nan'), True
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 ** 2 if sys.platform == 'darwin' else 1024
+    return pico / divisor, True
+
+
+def rerun_cronometrado(app: AppTest, latencias: list) -> None:
+    """
+    Reruns the app script once and stores the elapsed time in milliseconds.
+
+    Parameters:
+        app (AppTest): The headless app session to rerun.
+        latencias (list): The list that receives the measured latency.
+
+    Raises:
+        RuntimeError: If the rerun raised an exception inside the app.
+    """
+    inicio = time.perf_counter()
+    app.run(timeout=TIMEOUT_RERUN)
+    latencias.append((time.perf_counter() - inicio) * 1000)
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+
+
+def sessao(repeticoes: int) -> dict:
+    """
+    Drives one headless session through every page of the ``opcoes`` selector.
+
+    The pages are read from the sidebar selectbox of the running app, so new
+    pages are exercised without changes here. On the prediction page the
+    'Fazer Previsão' button is clicked to submit a prediction.
+
+    ``AppTest`` sets process-wide Streamlit state on every run, so each
+    session must run in its own process. The first run imports the app
+    modules (data, model, encoder and filter index), so it is a warm-up that
+    is neither timed nor counted in the session span.
+
+    Parameters:
+        repeticoes (int): How many times the session walks through all pages.
+
+    Returns:
+        dict: The latency in milliseconds of every rerun, the wall-clock start
+        and end of the session, the RSS of its process after the first load
+        and at the end of the session.
+    """
+    app = AppTest.from_file(ARQUIVO_APP, default_timeout=TIMEOUT_RERUN)
+    app.run(timeout=TIMEOUT_RERUN)
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    rss_carga, _ = memoria_rss_mb()
+    paginas = app.sidebar.selectbox[0].options
+
+    latencias: list = []
+    inicio = time.time()
+
+    for _ in range(repeticoes):
+        for pagina in paginas:
+            app.sidebar.selectbox[0].select(pagina)
+            rerun_cronometrado(app, latencias)
+            if pagina == PAGINA_PREDICAO:
+                app.button[0].click()
+                rerun_cronometrado(app, latencias)
+
+    rss, pico = memoria_rss_mb()
+    return {'latencias': latencias, 'inicio': inicio, 'fim': time.time(),
+            'rss_carga': rss_carga, 'rss': rss, 'pico': pico}
+
+
+def nivel_concorrencia(sessoes: int, repeticoes: int) -> dict:
+    """
+    Runs ``sessoes`` headless sessions in parallel and summarizes the results.
+
+    Each session runs in its own worker process. Throughput is measured over
+    the span of the sessions, excluding worker start-up and the first load,
+    and RSS is reported per worker: the mean after the first load and the
+    mean and maximum at the end of the sessions.
+
+    Parameters:
+        sessoes (int): Number of simultaneous sessions.
+        repeticoes (int): How many times each session walks through all pages.
+
+    Returns:
+        dict: Percentile latencies, throughput and per-worker RSS for the
+        level.
+    """
+    with ProcessPoolExecutor(max_workers=sessoes) as executor:
+        resultados = list(executor.map(sessao, [repeticoes] * sessoes))
+    duracao = (max(r['fim'] for r in resultados)
+               - min(r['inicio'] for r in resultados))
+
+    latencias = np.concatenate([np.asarray(r['latencias'])
+                                for r in resultados])
+    p50, p95, p99 = np.percentile(latencias, [50, 95, 99])
+    return {
+        'sessoes': sessoes,
+        'reruns': latencias.size,
+        'p50': p50,
+        'p95': p95,
+        'p99': p99,
+        'throughput': latencias.size / duracao,
+        'rss_carga': np.mean([r['rss_carga'] for r in resultados]),
+        'rss_medio': np.mean([r['rss'] for r in resultados]),
+        'rss_maximo': max(r['rss'] for r in resultados),
+        'pico': any(r['pico'] for r in resultados),
+    }
+
+
+def main() -> None:
+    """
+    Runs the load test for each concurrency level and prints a report table.
+
+    Example:
+        python teste_carga.py --niveis 1 2 4 8 16 --repeticoes 2
+    """
+    parser = argparse.ArgumentParser(
+        description='Teste de carga com sessões simultâneas do dashboard.')
+    parser.add_argument('--niveis', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 16],
+                        help='Quantidades de sessões simultâneas a testar.')
+    parser.add_argument('--repeticoes', type=int, default=1,
+                        help='Voltas por todas as páginas em cada sessão.')
+    args = parser.parse_args()
+
+    print('Uma sessão por processo: escalabilidade com processos isolados, '
+          'não a capacidade de um único servidor Streamlit. RSS por worker.')
+    print(f"{'sessões':>8} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'reruns/s':>9} {'RSS carga':>10} "
+          f"{'RSS médio':>10} {'RSS máx':>9}")
+    for sessoes in args.niveis:
+        r = nivel_concorrencia(sessoes, args.repeticoes)
+        rotulo_pico = ' (pico)' if r['pico'] else ''
+        print(f"{r['sessoes']:>8} {r['reruns']:>7} {r['p50']:>9.1f} "
+              f"{r['p95']:>9.1f} {r['p99']:>9.1f} {r['throughput']:>9.2f} "
+              f"{r['rss_carga']:>10.1f} {r['rss_medio']:>10.1f} "
+              f"{r['rss_maximo']:>9.1f}{rotulo_pico}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+import warnings
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from category_encoders import TargetEncoder
+
+COLUNAS = ['modelo', 'combustivel', 'ano', 'km', 'cor', 'cambio',
+           'cidade', 'airbag motorista', 'freios ABS', 'airbag passageiro',
+           'ar-condicionado', 'direção elétrica',
+           'volante com regulagem de altura', 'travas elétricas',
+           'cd player com MP3', 'entrada USB',
+           'vidros elétricos dianteiros',
+           'limajuste de alturap. traseiro',
+           'desemb. traseiro', 'alarme',
+           'ajuste de altura',
+           'distribuição eletrônica de frenagem,',
+           'controle de tração',
+           'retrovisores elétricos', 'piloto automático', 'Kit Multimídia',
+           'bancos de couro', 'limp. traseiro', 'motor']
+VARIAVEIS_CATEGORICAS = ['modelo', 'combustivel', 'cor', 'cidade']
+
+
+class Feature(NamedTuple):
+    """
+    Position and type of one model feature in the feature matrix.
+
+    Attributes:
+        posicao (int): Column index of the feature in the matrix.
+        tipo (str): 'categorica' for target encoded features or 'numerica'
+            for features transformed with log1p.
+    """
+    posicao: int
+    tipo: str
+
+
+def construir_esquema(colunas: list) -> dict:
+    """
+    Builds the schema registry that fixes the order and type of every feature.
+
+    Categorical features come first, followed by the numeric ones in the order
+    of ``colunas``, which is the column order the model was trained with.
+
+    Parameters:
+        colunas (list): The input columns expected by the model.
+
+    Returns:
+        dict: A mapping from column name to its ``Feature``.
+    """
+    numericas = [col for col in colunas if col not in VARIAVEIS_CATEGORICAS]
+    ordem = VARIAVEIS_CATEGORICAS + numericas
+    return {col: Feature(posicao, 'categorica' if col in VARIAVEIS_CATEGORICAS
+                         else 'numerica')
+            for posicao, col in enumerate(ordem)}
+
+
+def construir_tabelas_codificacao(dados) -> tuple:
+    """
+    Fits the target encoder once and turns it into plain lookup tables.
+
+    Parameters:
+        dados (pandas.DataFrame): The training data with the categorical
+            columns and the 'preco' target.
+
+    Returns:
+        tuple: A dict with one ``{valor: codificacao}`` table per categorical
+        column and the prior used for values not seen during training.
+    """
+    encoder = TargetEncoder()
+    encoder.fit(dados[VARIAVEIS_CATEGORICAS], dados['preco'])
+    valores_unicos = dados[VARIAVEIS_CATEGORICAS].drop_duplicates()
+    codificados = encoder.transform(valores_unicos)
+    tabelas = {col: dict(zip(valores_unicos[col], codificados[col]))
+               for col in VARIAVEIS_CATEGORICAS}
+    return tabelas, float(dados['preco'].mean())
+
+
+def verificar_ordem(modelo: object) -> None:
+    """
+    Checks the schema order against the model's fitted feature names.
+
+    The feature matrix is a bare ndarray, so sklearn can no longer match the
+    columns by name; a mismatch here would silently feed features to the
+    wrong splits.
+
+    Parameters:
+        modelo (object): The fitted model.
+
+    Raises:
+        ValueError: If the schema order differs from the model's features.
+    """
+    nomes_modelo = getattr(modelo, 'feature_names_in_', None)
+    if nomes_modelo is None:
+        return
+    ordem = sorted(ESQUEMA, key=lambda col: ESQUEMA[col].posicao)
+    if list(nomes_modelo) != ordem:
+        raise ValueError('A ordem das features do esquema difere da ordem '
+                         f'usada no treino do modelo: {list(nomes_modelo)}')
+
+
+def prever(modelo: object, matriz: np.ndarray) -> np.ndarray:
+    """
+    Predicts with the model on a schema-ordered feature matrix.
+
+    The "X does not have valid feature names" warning is silenced, which is
+    safe because the column order is checked by ``verificar_ordem``.
+
+    Parameters:
+        modelo (object): The fitted model.
+        matriz (numpy.ndarray): The feature matrix in schema order.
+
+    Returns:
+        numpy.ndarray: The model predictions.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning,
+                                message='X does not have valid feature names')
+        return modelo.predict(matriz)
+
+
+ESQUEMA = construir_esquema(COLUNAS)
+INICIO_NUMERICAS = len(VARIAVEIS_CATEGORICAS)
+TABELAS_CODIFICACAO, PRIOR_CODIFICACAO = construir_tabelas_codificacao(
+    pd.read_csv('dataframe_let.csv', sep=';'))
+
+
+def construir_matriz(entradas: list) -> np.ndarray:
+    """
+    Writes user inputs directly into a preallocated float64 feature matrix.
+
+    Categorical values are replaced by their target encoding and the numeric
+    block is transformed with log1p in place, so no DataFrame is created.
+
+    Parameters:
+        entradas (list): One dict per vehicle mapping column name to value.
+
+    Returns:
+        numpy.ndarray: A matrix with one row per vehicle, in schema order.
+    """
+    matriz = np.empty((len(entradas), len(ESQUEMA)), dtype=np.float64)
+    for linha, entrada in enumerate(entradas):
+        for col, feature in ESQUEMA.items():
+            if feature.tipo == 'categorica':
+                matriz[linha, feature.posicao] = TABELAS_CODIFICACAO[col].get(
+                    entrada[col], PRIOR_CODIFICACAO)
+            else:
+                matriz[linha, feature.posicao] = entrada[col]
+    numericas = matriz[:, INICIO_NUMERICAS:]
+    np.log1p(numericas, out=numericas)
+    return matriz
+
+
+def construir_vetor(entrada: dict) -> np.ndarray:
+    """
+    Builds the single-row feature matrix for one vehicle.
+
+    Parameters:
+        entrada (dict): A dict mapping column name to the user input value.
+
+    Returns:
+        numpy.ndarray: A matrix of shape (1, number of features).
+    """
+    return construir_matriz([entrada])